@@ -20,6 +20,24 @@ class Settings(BaseSettings):
     db_name: Optional[str] = None  # Database name (for IAM auth)
     db_port: int = 5432  # Database port
 
+    # SQLAlchemy connection pool
+    db_pool_size: int = 20  # Persistent connections kept in the pool
+    db_max_overflow: int = 10  # Extra connections allowed under burst load
+    db_pool_timeout: int = 5  # Seconds to wait for a connection before failing
+    db_pool_recycle: int = 1800  # Recycle connections older than this (seconds)
+    db_create_tables: bool = True  # Bootstrap schema on startup (disable once migrations own it)
+
+    @property
+    def iam_db_auth_enabled(self) -> bool:
+        """True when database connections authenticate with IAM tokens."""
+        return bool(
+            self.use_iam_db_auth
+            and self.environment == "production"
+            and self.db_endpoint
+            and self.db_name
+            and self.db_iam_user
+        )
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -31,17 +49,17 @@ def get_settings() -> Settings:
     settings = Settings()
     
     # Override database_url with IAM auth if enabled
-    if settings.use_iam_db_auth and settings.environment == "production":
+    if settings.iam_db_auth_enabled:
         from ..utils.db_iam_auth import build_iam_connection_string
         
-        # Build connection string with IAM token
-        if settings.db_endpoint and settings.db_name and settings.db_iam_user:
-            settings.database_url = build_iam_connection_string(
-                db_endpoint=settings.db_endpoint,
-                db_name=settings.db_name,
-                db_user=settings.db_iam_user,
-                port=settings.db_port,
-                region=settings.aws_region
-            )  # type: ignore
+        # Build connection string with IAM token (the token in the URL only
+        # covers the first connection; app.db swaps in a fresh one per connect)
+        settings.database_url = build_iam_connection_string(
+            db_endpoint=settings.db_endpoint,
+            db_name=settings.db_name,
+            db_user=settings.db_iam_user,
+            port=settings.db_port,
+            region=settings.aws_region
+        )  # type: ignore
     
     return settings
@@ -1,20 +1,97 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
-from .core.config import get_settings
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any, AsyncIterator, Dict
+from uuid import uuid4
+from .core.config import Settings, get_settings
 
 _settings = get_settings()
-_engine = create_engine(str(_settings.database_url), pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=_engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
-
-@contextmanager
-def session_scope() -> Session:
-    session: Session = SessionLocal()
-    try:
-        yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
+
+
+def _async_database_url(database_url: str) -> URL:
+    """Point a plain postgresql:// URL at the asyncpg driver.
+
+    asyncpg takes ``ssl`` instead of libpq's ``sslmode``, so that query
+    parameter is renamed as well.
+    """
+    url = make_url(database_url)
+    if url.drivername in ("postgresql", "postgresql+psycopg2"):
+        url = url.set(drivername="postgresql+asyncpg")
+    if url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        ssl_mode = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"]).update_query_dict({"ssl": ssl_mode})
+    return url
+
+
+def _connect_args(url: URL) -> Dict[str, Any]:
+    """Driver options that keep asyncpg from caching server-side prepared statements.
+
+    asyncpg prepares every statement and, together with SQLAlchemy's dialect,
+    caches them per connection. That breaks behind PgBouncer in transaction
+    mode, where consecutive statements may land on different server
+    connections, so both caches are disabled and prepared statements get
+    unique names.
+    """
+    if url.drivername != "postgresql+asyncpg":
+        return {}
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+_database_url = _async_database_url(str(_settings.database_url))
+_engine = create_async_engine(
+    _database_url,
+    connect_args=_connect_args(_database_url),
+    pool_size=_settings.db_pool_size,
+    max_overflow=_settings.db_max_overflow,
+    pool_timeout=_settings.db_pool_timeout,
+    # Recycle stale connections instead of pinging on every checkout
+    pool_recycle=_settings.db_pool_recycle,
+    pool_pre_ping=False,
+    # Reuse the most recently returned connection so hot connections stay warm
+    # and idle ones age out via pool_recycle
+    pool_use_lifo=True,
+)
+
+
+def _register_iam_token_refresh(engine: AsyncEngine, settings: Settings) -> None:
+    """Authenticate every new (or recycled) connection with a current IAM token.
+
+    The token baked into database_url expires after 15 minutes, so it cannot be
+    reused for reconnects; generate_iam_auth_token hands out a cached token
+    until shortly before expiry.
+    """
+    from .utils.db_iam_auth import generate_iam_auth_token
+
+    @event.listens_for(engine.sync_engine, "do_connect")
+    def _provide_iam_token(dialect, conn_rec, cargs, cparams):
+        cparams["password"] = generate_iam_auth_token(
+            settings.db_endpoint,
+            settings.db_port,
+            settings.db_iam_user,
+            settings.aws_region
+        )
+
+
+if _settings.iam_db_auth_enabled:
+    _register_iam_token_refresh(_engine, _settings)
+
+AsyncSessionLocal = async_sessionmaker(bind=_engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding a request-scoped async session.
+
+    Commits if the handler succeeds, rolls back on error and always returns
+    the connection to the pool once the request is finished.
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
@@ -1,21 +1,151 @@
 import os
-from fastapi import FastAPI, HTTPException, APIRouter
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, APIRouter, Depends
 from fastapi.middleware.cors import CORSMiddleware
-import boto3
-from botocore.exceptions import ClientError
+from fastapi.responses import ORJSONResponse, RedirectResponse
+import botocore.session
+from botocore.config import Config
+from cachetools import LRUCache, TTLCache
+from botocore.exceptions import BotoCoreError, ClientError
 from .core.config import get_settings
 from .schemas import PresignRequest, PresignResponse, FileRecord
 from .utils.id import generate_short_id
-from .db import session_scope
+from .utils.s3_presign import build_presigned_post
+from .db import get_db
 from . import models
-from sqlalchemy import inspect
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from .db import _engine
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
-s3_client = boto3.client('s3', region_name=settings.aws_region)
+# Single AWS session and S3 client shared by the whole process, built on
+# botocore directly to skip the boto3 wrapper layer; upload policies are
+# signed locally with the session's credentials
+_aws_session = botocore.session.get_session()
+s3_client = _aws_session.create_client(
+    's3',
+    region_name=settings.aws_region,
+    config=Config(signature_version='s3v4')
+)
+
+# Presigned download URLs are signed for 1 hour and reused for at most 30
+# minutes. A URL signed with temporary (instance role) credentials also stops
+# working when their session token expires, so the cache is dropped whenever
+# the credentials rotate; botocore rotates them at least 10 minutes early.
+DOWNLOAD_URL_EXPIRY_SECONDS = 3600
+DOWNLOAD_URL_CACHE_TTL_SECONDS = 1800
+_download_url_cache = TTLCache(maxsize=10000, ttl=DOWNLOAD_URL_CACHE_TTL_SECONDS)
+_download_url_cache_lock = threading.Lock()
+_download_url_cache_access_key: Optional[str] = None
+
+# Upload policy conditions that are the same for every request; only the
+# Content-Type condition is added per upload
+_BASE_UPLOAD_CONDITIONS = (
+    ["content-length-range", 0, settings.max_upload_bytes],
+)
+
+# File rows are never updated after creation, so their serialized metadata
+# can be cached indefinitely (bounded by LRU eviction)
+_file_record_cache = LRUCache(maxsize=50000)
+_file_record_cache_lock = threading.Lock()
 
-app = FastAPI(title="LinkBox API", version="0.1.0")
+_upload_url: Optional[str] = None
+
+def _get_upload_url() -> str:
+    """Return the bucket's POST URL as botocore resolves it.
+
+    Resolved once through the S3 client so custom endpoints (AWS_ENDPOINT_URL,
+    e.g. LocalStack) and path-style addressing for dotted bucket names apply.
+    """
+    global _upload_url
+    if _upload_url is None:
+        _upload_url = s3_client.generate_presigned_post(
+            Bucket=settings.s3_bucket_name,
+            Key='__warmup__'
+        )['url']
+    return _upload_url
+
+def _warmup_s3():
+    """Sign a throwaway URL so the signer, service model and endpoint rules
+    are loaded at startup rather than on the first user request."""
+    try:
+        s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': settings.s3_bucket_name, 'Key': '__warmup__'},
+            ExpiresIn=60
+        )
+        _get_upload_url()
+    except (BotoCoreError, ClientError) as e:
+        logger.warning(f"S3 client warmup failed: {e}")
+
+def _get_cached_presigned(s3_key: str) -> str:
+    """Return a presigned GET URL for s3_key, signing a new one only when the
+    cached URL is missing, too close to expiry or signed with rotated credentials."""
+    global _download_url_cache_access_key
+    credentials = _aws_session.get_credentials()
+    # Freezing refreshes credentials that are close to expiry
+    access_key = credentials.get_frozen_credentials().access_key if credentials else None
+    with _download_url_cache_lock:
+        if access_key != _download_url_cache_access_key:
+            _download_url_cache.clear()
+            _download_url_cache_access_key = access_key
+        url = _download_url_cache.get(s3_key)
+    if url is None:
+        url = s3_client.generate_presigned_url(
+            'get_object',
+            Params={
+                'Bucket': settings.s3_bucket_name,
+                'Key': s3_key
+            },
+            ExpiresIn=DOWNLOAD_URL_EXPIRY_SECONDS
+        )
+        with _download_url_cache_lock:
+            _download_url_cache[s3_key] = url
+    return url
+
+async def _get_file_record(db: AsyncSession, file_id: str) -> Optional[dict]:
+    """Return the JSON-ready FileRecord for file_id, or None if it doesn't exist."""
+    with _file_record_cache_lock:
+        record = _file_record_cache.get(file_id)
+    if record is None:
+        result = await db.get(models.FileObject, file_id)
+        if result is None:
+            return None
+        record = FileRecord.model_validate(result).model_dump(mode='json')
+        with _file_record_cache_lock:
+            _file_record_cache[file_id] = record
+    return record
+
+async def _create_tables():
+    # Create tables if not exist (simple bootstrap; for prod use migrations)
+    async with _engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema bootstrap waits on Postgres while the S3 warmup is CPU-bound in a
+    # worker thread, so run them concurrently to shorten startup
+    loop = asyncio.get_running_loop()
+    startup_tasks = [loop.run_in_executor(None, _warmup_s3)]
+    if settings.db_create_tables:
+        startup_tasks.append(_create_tables())
+    await asyncio.gather(*startup_tasks)
+    yield
+    await _engine.dispose()
+
+app = FastAPI(
+    title="LinkBox API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 api_router = APIRouter(prefix="/api")
 
 # Allow simple CORS (CloudFront + local dev)
@@ -27,67 +157,55 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-def startup():
-    # Create tables if not exist (simple bootstrap; for prod use migrations)
-    models.Base.metadata.create_all(bind=_engine)
-    inspector = inspect(_engine)
-    if 'files' not in inspector.get_table_names():
-        models.Base.metadata.create_all(bind=_engine)
-
 @api_router.get("/health")
 async def health():
     return {"status": "ok"}
 
 @api_router.post("/generate-presigned-url", response_model=PresignResponse)
-async def generate_presigned_url(req: PresignRequest):
+async def generate_presigned_url(req: PresignRequest, db: AsyncSession = Depends(get_db)):
     file_id = generate_short_id(6)
     s3_key = f"uploads/{file_id}-{req.filename}"
 
-    conditions = [
-        {"Content-Type": req.content_type},
-        ["content-length-range", 0, settings.max_upload_bytes]
-    ]
-
-    fields = {
-        "Content-Type": req.content_type
-    }
-
-    try:
-        presigned = s3_client.generate_presigned_post(
-            Bucket=settings.s3_bucket_name,
-            Key=s3_key,
-            Fields=fields,
-            Conditions=conditions,
-            ExpiresIn=settings.presigned_expiry_seconds
-        )
-    except ClientError as e:
-        raise HTTPException(status_code=500, detail="Failed to create presigned URL") from e
+    conditions = [{"Content-Type": req.content_type}, *_BASE_UPLOAD_CONDITIONS]
+    fields = {"Content-Type": req.content_type}
+
+    credentials = _aws_session.get_credentials()
+    if credentials is None:
+        raise HTTPException(status_code=500, detail="Failed to create presigned URL")
+
+    presigned = build_presigned_post(
+        url=_get_upload_url(),
+        bucket=settings.s3_bucket_name,
+        key=s3_key,
+        region=settings.aws_region,
+        # Refreshable (instance role) credentials rotate; freeze per request
+        credentials=credentials.get_frozen_credentials(),
+        fields=fields,
+        conditions=conditions,
+        expires_in=settings.presigned_expiry_seconds
+    )
 
     # Persist metadata (size may be unknown until client sends; accept provided size hint)
-    with session_scope() as session:
-        record = models.FileObject(
+    # Core insert: the row is never read back here, so skip ORM unit-of-work bookkeeping
+    await db.execute(
+        insert(models.FileObject).values(
             id=file_id,
             original_filename=req.filename,
             s3_key=s3_key,
             content_type=req.content_type,
             size_bytes=req.size_bytes,
         )
-        session.add(record)
+    )
+    # Commit before responding so the file id is resolvable as soon as the client has it
+    await db.commit()
+    with _file_record_cache_lock:
+        _file_record_cache.pop(file_id, None)
 
-    # Generate presigned download URL (temporary, expires in 5 minutes)
-    try:
-        download_url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={
-                'Bucket': settings.s3_bucket_name,
-                'Key': s3_key
-            },
-            ExpiresIn=300  # 5 minutes
-        )
-    except ClientError as e:
-        # Fallback to file ID based URL
-        download_url = f"/api/files/{file_id}/download"
+    # Share link points at the download endpoint, which signs (and caches) a
+    # GET URL on demand, so only the upload policy is signed here
+    download_url = f"/api/files/{file_id}/download"
+    if settings.cloudfront_download_domain:
+        download_url = f"https://{settings.cloudfront_download_domain}{download_url}"
 
     return PresignResponse(
         upload_url=presigned['url'],
@@ -97,41 +215,27 @@ async def generate_presigned_url(req: PresignRequest):
     )
 
 @api_router.get("/files/{file_id}", response_model=FileRecord)
-async def get_file_metadata(file_id: str):
-    from sqlalchemy import select
-    from .db import SessionLocal
-    with SessionLocal() as session:
-        result = session.execute(select(models.FileObject).where(models.FileObject.id == file_id)).scalars().first()
-        if not result:
-            raise HTTPException(status_code=404, detail="Not found")
-        return result
+async def get_file_metadata(file_id: str, db: AsyncSession = Depends(get_db)):
+    record = await _get_file_record(db, file_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    # Already serialized by the cache; skip response_model re-validation
+    return ORJSONResponse(content=record)
 
 @api_router.get("/files/{file_id}/download")
-async def get_download_url(file_id: str):
+async def get_download_url(file_id: str, db: AsyncSession = Depends(get_db)):
     """Generate a fresh presigned download URL for a file"""
-    from sqlalchemy import select
-    from .db import SessionLocal
-    from fastapi.responses import RedirectResponse
+    record = await _get_file_record(db, file_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="File not found")
     
-    with SessionLocal() as session:
-        result = session.execute(select(models.FileObject).where(models.FileObject.id == file_id)).scalars().first()
-        if not result:
-            raise HTTPException(status_code=404, detail="File not found")
-        
-        # Generate presigned URL
-        try:
-            download_url = s3_client.generate_presigned_url(
-                'get_object',
-                Params={
-                    'Bucket': settings.s3_bucket_name,
-                    'Key': result.s3_key
-                },
-                ExpiresIn=3600  # 1 hour for on-demand downloads
-            )
-            # Redirect to the presigned URL
-            return RedirectResponse(url=download_url)
-        except ClientError as e:
-            raise HTTPException(status_code=500, detail="Failed to generate download URL") from e
+    # Generate presigned URL
+    try:
+        download_url = _get_cached_presigned(record['s3_key'])
+        # Redirect to the presigned URL
+        return RedirectResponse(url=download_url)
+    except ClientError as e:
+        raise HTTPException(status_code=500, detail="Failed to generate download URL") from e
 
 # Include the API router
 app.include_router(api_router)
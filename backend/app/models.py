@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, BigInteger
+from sqlalchemy import Column, String, Text, DateTime, BigInteger, func
 from sqlalchemy.orm import declarative_base
 from datetime import datetime, timezone
 
@@ -6,9 +6,16 @@ Base = declarative_base()
 
 class FileObject(Base):
     __tablename__ = 'files'
-    id = Column(String(12), primary_key=True, index=True)  # short share id
-    original_filename = Column(String(512), nullable=False)
-    s3_key = Column(String(1024), nullable=False, unique=True)
-    content_type = Column(String(255), nullable=True)
+    id = Column(String(12), primary_key=True)  # short share id
+    original_filename = Column(Text, nullable=False)
+    s3_key = Column(Text, nullable=False)  # derived from id, so already unique
+    content_type = Column(Text, nullable=True)
     size_bytes = Column(BigInteger, nullable=True)
-    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    # Python default keeps inserts working on tables created before the server
+    # default existed (create_all never alters them); new tables get both
+    created_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
@@ -13,9 +13,7 @@ class PresignResponse(BaseModel):
     file_id: str
     download_url: str
     
-    model_config = {
-        "populate_by_name": True,
-    }
+    model_config = ConfigDict(populate_by_name=True)
 
 class FileRecord(BaseModel):
     id: str
@@ -25,5 +23,4 @@ class FileRecord(BaseModel):
     size_bytes: Optional[int]
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
@@ -12,11 +12,38 @@ Benefits:
 """
 
 import boto3
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Tokens are valid for 15 minutes; refresh a little early so a token handed out
+# here never expires mid-connect.
+TOKEN_LIFETIME_SECONDS = 15 * 60
+TOKEN_REFRESH_MARGIN_SECONDS = 2 * 60
+
+# RDS clients per region, created on first use (client construction loads the
+# botocore service model, which is far more expensive than signing a token)
+_rds_clients: Dict[str, Any] = {}
+
+# (endpoint, user, port, region) -> (token, monotonic expiry)
+_token_cache: Dict[Tuple[str, str, int, str], Tuple[str, float]] = {}
+
+
+def _get_rds_client(region: str) -> Any:
+    """Return the cached RDS client for a region, creating it if needed."""
+    client = _rds_clients.get(region)
+    if client is None:
+        client = boto3.client('rds', region_name=region)
+        _rds_clients[region] = client
+    return client
+
+
+def clear_token_cache() -> None:
+    """Drop all cached IAM auth tokens (forces regeneration on next call)."""
+    _token_cache.clear()
+
 
 def generate_iam_auth_token(
     db_endpoint: str,
@@ -34,7 +61,8 @@ def generate_iam_auth_token(
         region: AWS region (auto-detected if None)
     
     Returns:
-        Temporary auth token (valid for 15 minutes)
+        Temporary auth token (valid for 15 minutes). Tokens are cached per
+        (endpoint, user, port, region) and reused until shortly before expiry.
     
     Raises:
         ClientError: If unable to generate token
@@ -55,9 +83,16 @@ def generate_iam_auth_token(
             session = boto3.Session()
             region = session.region_name or 'us-east-1'
         
+        cache_key = (db_endpoint, db_user, port, region)
+        cached = _token_cache.get(cache_key)
+        if cached is not None:
+            token, expires_at = cached
+            if time.monotonic() < expires_at - TOKEN_REFRESH_MARGIN_SECONDS:
+                return token
+        
         logger.info(f"Generating IAM auth token for {db_user}@{db_endpoint}")
         
-        client = boto3.client('rds', region_name=region)
+        client = _get_rds_client(region)
         
         token = client.generate_db_auth_token(
             DBHostname=db_endpoint,
@@ -65,6 +100,7 @@ def generate_iam_auth_token(
             DBUsername=db_user,
             Region=region
         )
+        _token_cache[cache_key] = (token, time.monotonic() + TOKEN_LIFETIME_SECONDS)
         
         logger.info("IAM auth token generated successfully")
         return token
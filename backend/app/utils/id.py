@@ -2,13 +2,26 @@ import secrets
 import string
 
 ALPHABET = string.ascii_letters + string.digits
+_ALPHABET_CHARS = tuple(ALPHABET)
+_BASE = len(_ALPHABET_CHARS)
+# Largest multiple of len(ALPHABET) that fits in a byte; bytes at or above it
+# are rejected so every character stays equally likely.
+_REJECT_AT = 256 - (256 % _BASE)
 
 def generate_short_id(length: int = 6) -> str:
     """Generate a URL-safe short id comprised of letters+digits.
 
-    Uses secrets.choice for cryptographic randomness. Default length 6 yields
-    62^6 (~56B) possibilities.
+    Draws random bytes from secrets.token_bytes in one call and maps them onto
+    the alphabet with rejection sampling, keeping cryptographic, unbiased
+    randomness. Default length 6 yields 62^6 (~56B) possibilities.
     """
     if length <= 0:
         raise ValueError("length must be > 0")
-    return ''.join(secrets.choice(ALPHABET) for _ in range(length))
+    out = []
+    while len(out) < length:
+        for b in secrets.token_bytes(length * 2):
+            if b < _REJECT_AT:
+                out.append(_ALPHABET_CHARS[b % _BASE])
+                if len(out) == length:
+                    break
+    return ''.join(out)
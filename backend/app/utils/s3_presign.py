@@ -0,0 +1,103 @@
+"""
+Presigned S3 POST Builder
+
+Builds the same ``{"url": ..., "fields": ...}`` payload as botocore's
+``generate_presigned_post`` (SigV4), without going through botocore's generic
+request/serializer/signer pipeline on every call.
+
+Only the policy document changes per upload; the SigV4 signing key depends on
+the secret key, date, region and service alone, so it is derived once per day
+and cached.
+
+Reference: https://docs.aws.amazon.com/AmazonS3/latest/API/sigv4-UsingHTTPPOST.html
+"""
+
+import base64
+import datetime
+import hashlib
+import hmac
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+SIGV4_ALGORITHM = 'AWS4-HMAC-SHA256'
+SIGV4_TIMESTAMP = '%Y%m%dT%H%M%SZ'
+ISO8601 = '%Y-%m-%dT%H:%M:%SZ'
+
+
+@lru_cache(maxsize=4)
+def _derive_signing_key(secret_key: str, date_stamp: str, region: str, service: str = 's3') -> bytes:
+    """Derive the SigV4 signing key (kDate -> kRegion -> kService -> kSigning)."""
+    k_date = hmac.new(f"AWS4{secret_key}".encode('utf-8'), date_stamp.encode('utf-8'), hashlib.sha256).digest()
+    k_region = hmac.new(k_date, region.encode('utf-8'), hashlib.sha256).digest()
+    k_service = hmac.new(k_region, service.encode('utf-8'), hashlib.sha256).digest()
+    return hmac.new(k_service, b'aws4_request', hashlib.sha256).digest()
+
+
+def build_presigned_post(
+    url: str,
+    bucket: str,
+    key: str,
+    region: str,
+    credentials: Any,
+    fields: Optional[Dict[str, str]] = None,
+    conditions: Optional[List[Any]] = None,
+    expires_in: int = 3600,
+    now: Optional[datetime.datetime] = None
+) -> Dict[str, Any]:
+    """
+    Build a SigV4 presigned POST for uploading a single object.
+
+    Args:
+        url: Bucket POST URL as resolved by the S3 client (endpoint and
+            addressing style are not rebuilt here)
+        bucket: Target S3 bucket
+        key: Object key to upload to
+        region: Bucket region
+        credentials: Frozen AWS credentials (access_key, secret_key, token)
+        fields: Extra form fields to include (e.g. Content-Type)
+        conditions: Extra policy conditions; bucket/key/signing conditions
+            are added automatically
+        expires_in: Policy lifetime in seconds
+        now: Signing time (defaults to the current UTC time)
+
+    Returns:
+        Dict with ``url`` and ``fields``, same shape as
+        ``s3_client.generate_presigned_post``
+    """
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    timestamp = now.strftime(SIGV4_TIMESTAMP)
+    date_stamp = timestamp[:8]
+    credential = f"{credentials.access_key}/{date_stamp}/{region}/s3/aws4_request"
+
+    post_fields = dict(fields or {})
+    post_fields['key'] = key
+    post_fields['x-amz-algorithm'] = SIGV4_ALGORITHM
+    post_fields['x-amz-credential'] = credential
+    post_fields['x-amz-date'] = timestamp
+
+    policy_conditions = list(conditions or [])
+    policy_conditions.append({'bucket': bucket})
+    policy_conditions.append({'key': key})
+    policy_conditions.append({'x-amz-algorithm': SIGV4_ALGORITHM})
+    policy_conditions.append({'x-amz-credential': credential})
+    policy_conditions.append({'x-amz-date': timestamp})
+
+    if credentials.token is not None:
+        post_fields['x-amz-security-token'] = credentials.token
+        policy_conditions.append({'x-amz-security-token': credentials.token})
+
+    policy = {
+        'expiration': (now + datetime.timedelta(seconds=expires_in)).strftime(ISO8601),
+        'conditions': policy_conditions,
+    }
+    encoded_policy = base64.b64encode(json.dumps(policy).encode('utf-8')).decode('utf-8')
+    signing_key = _derive_signing_key(credentials.secret_key, date_stamp, region)
+
+    post_fields['policy'] = encoded_policy
+    post_fields['x-amz-signature'] = hmac.new(
+        signing_key, encoded_policy.encode('utf-8'), hashlib.sha256
+    ).hexdigest()
+
+    return {'url': url, 'fields': post_fields}
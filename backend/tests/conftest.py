@@ -0,0 +1,11 @@
+import os
+import tempfile
+
+# Settings are read once at import of the app, so point it at a throwaway
+# SQLite database and dummy AWS credentials before any test imports it
+_db_dir = tempfile.mkdtemp(prefix="linkbox-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/test.db"
+os.environ["USE_IAM_DB_AUTH"] = "false"
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+os.environ.pop("AWS_SESSION_TOKEN", None)
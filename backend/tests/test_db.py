@@ -0,0 +1,50 @@
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import db
+from app.core.config import Settings
+from app.utils import db_iam_auth
+
+
+def _iam_settings():
+    return Settings(
+        environment="production",
+        use_iam_db_auth=True,
+        db_endpoint="db.example.com",
+        db_name="linkbox",
+        db_iam_user="iam_user",
+        db_port=5432,
+        aws_region="us-east-1",
+    )
+
+
+def test_iam_auth_enabled_requires_full_configuration():
+    assert _iam_settings().iam_db_auth_enabled
+    assert not Settings(use_iam_db_auth=True, environment="dev").iam_db_auth_enabled
+    assert not Settings(use_iam_db_auth=True, environment="production").iam_db_auth_enabled
+
+
+def test_each_connect_uses_current_iam_token(monkeypatch):
+    tokens = iter(["token-1", "token-2"])
+    monkeypatch.setattr(db_iam_auth, "generate_iam_auth_token", lambda *args: next(tokens))
+    engine = create_async_engine("postgresql+asyncpg://iam_user@db.example.com/linkbox")
+    db._register_iam_token_refresh(engine, _iam_settings())
+
+    passwords = []
+    for _ in range(2):
+        cparams = {"password": "expired-token"}
+        dialect = engine.sync_engine.dialect
+        dialect.dispatch.do_connect(dialect, None, [], cparams)
+        passwords.append(cparams["password"])
+
+    assert passwords == ["token-1", "token-2"]
+
+
+def test_asyncpg_statement_caches_are_disabled():
+    args = db._connect_args(db._async_database_url("postgresql://u:p@h/d"))
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    assert args["prepared_statement_name_func"]() != args["prepared_statement_name_func"]()
+
+
+def test_connect_args_only_apply_to_asyncpg():
+    assert db._connect_args(db._async_database_url("sqlite+aiosqlite://")) == {}
@@ -0,0 +1,43 @@
+from app.utils import db_iam_auth
+
+
+class FakeRDSClient:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_db_auth_token(self, DBHostname, Port, DBUsername, Region):
+        self.calls += 1
+        return f"token-{self.calls}"
+
+
+def _install_fake_client(monkeypatch):
+    client = FakeRDSClient()
+    monkeypatch.setattr(db_iam_auth, "_get_rds_client", lambda region: client)
+    db_iam_auth.clear_token_cache()
+    return client
+
+
+def test_token_is_reused_while_valid(monkeypatch):
+    client = _install_fake_client(monkeypatch)
+    first = db_iam_auth.generate_iam_auth_token("db.example.com", 5432, "iam_user", "us-east-1")
+    second = db_iam_auth.generate_iam_auth_token("db.example.com", 5432, "iam_user", "us-east-1")
+    assert first == second
+    assert client.calls == 1
+
+
+def test_token_is_regenerated_near_expiry(monkeypatch):
+    client = _install_fake_client(monkeypatch)
+    now = [1000.0]
+    monkeypatch.setattr(db_iam_auth.time, "monotonic", lambda: now[0])
+    first = db_iam_auth.generate_iam_auth_token("db.example.com", 5432, "iam_user", "us-east-1")
+    now[0] += db_iam_auth.TOKEN_LIFETIME_SECONDS - db_iam_auth.TOKEN_REFRESH_MARGIN_SECONDS
+    second = db_iam_auth.generate_iam_auth_token("db.example.com", 5432, "iam_user", "us-east-1")
+    assert first != second
+    assert client.calls == 2
+
+
+def test_token_cache_is_keyed_per_user(monkeypatch):
+    client = _install_fake_client(monkeypatch)
+    db_iam_auth.generate_iam_auth_token("db.example.com", 5432, "user_a", "us-east-1")
+    db_iam_auth.generate_iam_auth_token("db.example.com", 5432, "user_b", "us-east-1")
+    assert client.calls == 2
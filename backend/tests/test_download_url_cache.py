@@ -0,0 +1,74 @@
+from botocore.credentials import ReadOnlyCredentials
+from cachetools import TTLCache
+
+from app import main
+
+
+class FakeCredentials:
+    def __init__(self, access_key):
+        self.access_key = access_key
+
+    def get_frozen_credentials(self):
+        return ReadOnlyCredentials(self.access_key, "secret", "token")
+
+
+class FakeSession:
+    def __init__(self):
+        self.credentials = FakeCredentials("AKID1")
+
+    def get_credentials(self):
+        return self.credentials
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.calls += 1
+        return f"https://example.com/{Params['Key']}?sig={self.calls}"
+
+
+def _setup(monkeypatch):
+    now = [0.0]
+    session = FakeSession()
+    client = FakeS3Client()
+    monkeypatch.setattr(main, "_aws_session", session)
+    monkeypatch.setattr(main, "s3_client", client)
+    monkeypatch.setattr(
+        main,
+        "_download_url_cache",
+        TTLCache(maxsize=100, ttl=main.DOWNLOAD_URL_CACHE_TTL_SECONDS, timer=lambda: now[0]),
+    )
+    monkeypatch.setattr(main, "_download_url_cache_access_key", None)
+    return now, session, client
+
+
+def test_cache_hit_reuses_signed_url(monkeypatch):
+    _, _, client = _setup(monkeypatch)
+    first = main._get_cached_presigned("uploads/a")
+    assert main._get_cached_presigned("uploads/a") == first
+    assert client.calls == 1
+
+
+def test_cache_miss_signs_per_key(monkeypatch):
+    _, _, client = _setup(monkeypatch)
+    main._get_cached_presigned("uploads/a")
+    main._get_cached_presigned("uploads/b")
+    assert client.calls == 2
+
+
+def test_cached_url_expires_after_ttl(monkeypatch):
+    now, _, client = _setup(monkeypatch)
+    first = main._get_cached_presigned("uploads/a")
+    now[0] += main.DOWNLOAD_URL_CACHE_TTL_SECONDS
+    assert main._get_cached_presigned("uploads/a") != first
+    assert client.calls == 2
+
+
+def test_credential_rotation_drops_cached_urls(monkeypatch):
+    _, session, client = _setup(monkeypatch)
+    first = main._get_cached_presigned("uploads/a")
+    session.credentials = FakeCredentials("AKID2")
+    assert main._get_cached_presigned("uploads/a") != first
+    assert client.calls == 2
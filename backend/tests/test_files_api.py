@@ -0,0 +1,75 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app import main
+from app.db import _engine
+
+
+@pytest.fixture
+def client():
+    main._file_record_cache.clear()
+    with TestClient(main.app) as c:
+        yield c
+
+
+@pytest.fixture
+def db_queries():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(_engine.sync_engine, "before_cursor_execute", _record)
+
+
+def _upload(client):
+    resp = client.post(
+        "/api/generate-presigned-url",
+        json={"filename": "notes.txt", "content_type": "text/plain", "size_bytes": 3},
+    )
+    assert resp.status_code == 200
+    return resp.json()["file_id"]
+
+
+def test_second_metadata_lookup_skips_database(client, db_queries):
+    file_id = _upload(client)
+
+    first = client.get(f"/api/files/{file_id}")
+    assert first.status_code == 200
+    assert db_queries
+
+    db_queries.clear()
+    second = client.get(f"/api/files/{file_id}")
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert db_queries == []
+
+
+def test_unknown_id_returns_404_and_is_not_cached(client, db_queries):
+    for _ in range(2):
+        db_queries.clear()
+        resp = client.get("/api/files/nope00")
+        assert resp.status_code == 404
+        assert db_queries
+    assert "nope00" not in main._file_record_cache
+
+
+def test_presign_evicts_cached_id(client, monkeypatch):
+    monkeypatch.setattr(main, "generate_short_id", lambda length: "evict1")
+    main._file_record_cache["evict1"] = {"id": "evict1", "s3_key": "stale"}
+    _upload(client)
+    assert "evict1" not in main._file_record_cache
+
+
+def test_download_redirect_uses_cached_s3_key(client, db_queries):
+    file_id = _upload(client)
+    s3_key = client.get(f"/api/files/{file_id}").json()["s3_key"]
+
+    db_queries.clear()
+    resp = client.get(f"/api/files/{file_id}/download", follow_redirects=False)
+    assert resp.status_code == 307
+    assert s3_key in resp.headers["location"]
+    assert db_queries == []
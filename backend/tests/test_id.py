@@ -14,3 +14,8 @@ def test_generate_short_id_invalid():
     import pytest
     with pytest.raises(ValueError):
         generate_short_id(0)
+
+def test_generate_short_id_long_length_uses_alphabet_only():
+    _id = generate_short_id(500)
+    assert len(_id) == 500
+    assert re.match(r'^[A-Za-z0-9]{500}$', _id)
@@ -0,0 +1,35 @@
+from sqlalchemy import create_engine, insert, select, text
+
+from app import models
+
+# files table as created by the original schema: NOT NULL created_at with no
+# database-side default
+BASELINE_FILES_DDL = """
+CREATE TABLE files (
+    id VARCHAR(12) NOT NULL PRIMARY KEY,
+    original_filename VARCHAR(512) NOT NULL,
+    s3_key VARCHAR(1024) NOT NULL UNIQUE,
+    content_type VARCHAR(255),
+    size_bytes BIGINT,
+    created_at DATETIME NOT NULL
+)
+"""
+
+
+def test_insert_works_against_baseline_schema():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text(BASELINE_FILES_DDL))
+        conn.execute(
+            insert(models.FileObject).values(
+                id="abc123",
+                original_filename="notes.txt",
+                s3_key="uploads/abc123-notes.txt",
+                content_type="text/plain",
+                size_bytes=3,
+            )
+        )
+        created_at = conn.execute(
+            select(models.FileObject.created_at).where(models.FileObject.id == "abc123")
+        ).scalar_one()
+    assert created_at is not None
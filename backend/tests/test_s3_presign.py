@@ -0,0 +1,92 @@
+import datetime
+
+import boto3
+import botocore.auth
+import botocore.signers
+from botocore.config import Config
+from botocore.credentials import ReadOnlyCredentials
+
+from app import main
+from app.utils.s3_presign import build_presigned_post
+
+NOW = datetime.datetime(2025, 10, 14, 12, 30, 0, tzinfo=datetime.timezone.utc)
+
+
+def _client(region, token=None, endpoint_url=None):
+    return boto3.client(
+        "s3",
+        region_name=region,
+        endpoint_url=endpoint_url,
+        aws_access_key_id="AKIDEXAMPLE",
+        aws_secret_access_key="secret",
+        aws_session_token=token,
+        config=Config(signature_version="s3v4"),
+    )
+
+
+def _botocore_presigned_post(monkeypatch, client, **kwargs):
+    monkeypatch.setattr(botocore.auth, "get_current_datetime", lambda: NOW.replace(tzinfo=None))
+    monkeypatch.setattr(botocore.signers, "get_current_datetime", lambda: NOW.replace(tzinfo=None))
+    return client.generate_presigned_post(**kwargs)
+
+
+def _kwargs(bucket="linkbox-test"):
+    return dict(
+        Bucket=bucket,
+        Key="uploads/abc123-file.txt",
+        Fields={"Content-Type": "text/plain"},
+        Conditions=[{"Content-Type": "text/plain"}, ["content-length-range", 0, 1024]],
+        ExpiresIn=3600,
+    )
+
+
+def _build(url, region, token=None, bucket="linkbox-test"):
+    kwargs = _kwargs(bucket)
+    return build_presigned_post(
+        url=url,
+        bucket=kwargs["Bucket"],
+        key=kwargs["Key"],
+        region=region,
+        credentials=ReadOnlyCredentials("AKIDEXAMPLE", "secret", token),
+        fields=kwargs["Fields"],
+        conditions=kwargs["Conditions"],
+        expires_in=kwargs["ExpiresIn"],
+        now=NOW,
+    )
+
+
+def _upload_url_for(monkeypatch, client, bucket):
+    monkeypatch.setattr(main, "s3_client", client)
+    monkeypatch.setattr(main.settings, "s3_bucket_name", bucket)
+    monkeypatch.setattr(main, "_upload_url", None)
+    return main._get_upload_url()
+
+
+def test_matches_botocore_presigned_post(monkeypatch):
+    client = _client("us-east-1")
+    expected = _botocore_presigned_post(monkeypatch, client, **_kwargs())
+    url = _upload_url_for(monkeypatch, client, "linkbox-test")
+    assert _build(url, "us-east-1") == expected
+
+
+def test_matches_botocore_with_session_token_and_other_region(monkeypatch):
+    client = _client("eu-west-1", token="session-token")
+    expected = _botocore_presigned_post(monkeypatch, client, **_kwargs())
+    url = _upload_url_for(monkeypatch, client, "linkbox-test")
+    assert _build(url, "eu-west-1", token="session-token") == expected
+
+
+def test_upload_url_honours_custom_endpoint(monkeypatch):
+    client = _client("us-east-1", endpoint_url="http://localhost:4566")
+    expected = _botocore_presigned_post(monkeypatch, client, **_kwargs("linkbox-local"))
+    url = _upload_url_for(monkeypatch, client, "linkbox-local")
+    assert url.startswith("http://localhost:4566")
+    assert _build(url, "us-east-1", bucket="linkbox-local") == expected
+
+
+def test_upload_url_uses_path_style_for_dotted_bucket(monkeypatch):
+    client = _client("us-east-1")
+    expected = _botocore_presigned_post(monkeypatch, client, **_kwargs("my.bucket"))
+    url = _upload_url_for(monkeypatch, client, "my.bucket")
+    assert url == expected["url"]
+    assert "my.bucket.s3" not in url
@@ -47,7 +47,8 @@ export const UploadForm: React.FC = () => {
         headers: { 'Content-Type': 'multipart/form-data' },
       });
 
-      setSharedLink(download_url);
+      // Backend may return a path relative to this site
+      setSharedLink(new URL(download_url, window.location.origin).toString());
     } catch (err: any) {
       console.error('Upload error:', err);
       setError(err.message || 'Upload failed');